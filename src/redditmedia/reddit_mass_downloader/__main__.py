@@ -0,0 +1,6 @@
+# reddit_mass_downloader/__main__.py
+# Allows `python -m redditmedia.reddit_mass_downloader ...`
+from .cli import main
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,17 @@
 
 import argparse
 import asyncio
-from typing import List, Tuple, Optional
-
-from .downloader_pipeline import DownloaderPipeline
-from ..redditcommand.utils.session import GlobalSession
+import contextlib
+import json
+import os
+import sys
+from typing import Any, Dict, List, Tuple, Optional
 
 VALID_TIMES = {"all", "year", "month", "week", "day"}
 VALID_TYPES = {"image", "video"}
+DEFAULT_DAEMON_PORT = 8765
+# Flags that apply to every job of a --combos-file run (what to fetch stays per line)
+COMBO_RUN_WIDE_OPTIONS = ("concurrency", "blacklist", "redownload", "no_outcomes", "cache_ttl")
 
 
 def parse_telegramish(args: List[str]) -> Tuple[Optional[str], List[str], List[str], int, Optional[str], str]:
@@ -41,58 +45,263 @@ def parse_telegramish(args: List[str]) -> Tuple[Optional[str], List[str], List[s
     return time_filter, subreddits, search_terms, media_count, media_type, sort
 
 
-def build_argparser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(description="Reddit Mass Downloader (CLI)")
-    p.add_argument("cmd", nargs="*", help="Telegram-like command tokens, e.g. /r year kpop sana 5 image")
+def dedupe_tokens(items: List[str], label: str) -> List[str]:
+    """Drop repeated items (case-insensitive), keeping first-seen order."""
+    keys = [s.lower() for s in items]
+    if len(set(keys)) == len(keys):
+        return items
+    seen = set()
+    unique = []
+    for key, item in zip(keys, items):
+        if key not in seen:
+            seen.add(key)
+            unique.append(item)
+    print(f"Warning: duplicate {label} dropped ({len(items) - len(unique)})", file=sys.stderr)
+    return unique
+
+
+def parse_blacklist(raw: Optional[str]) -> List[str]:
+    """Normalize the --blacklist value once: casefold, '_' as space, de-duplicated."""
+    terms = (t.strip().casefold().replace("_", " ") for t in (raw or "").split(","))
+    return list(dict.fromkeys(t for t in terms if t))
+
+
+class CliArgumentError(Exception):
+    """Argument error raised (instead of printed + exit 2) by parsers built with raise_on_error."""
+
+
+class _RaisingArgumentParser(argparse.ArgumentParser):
+    def error(self, message):
+        raise CliArgumentError(message)
+
+
+def build_argparser(raise_on_error: bool = False) -> argparse.ArgumentParser:
+    parser_cls = _RaisingArgumentParser if raise_on_error else argparse.ArgumentParser
+    # No --help when errors are reported elsewhere: it would print to the wrong console
+    p = parser_cls(description="Reddit Mass Downloader (CLI)", add_help=not raise_on_error)
+    p.add_argument("cmd", nargs="*", help="Telegram-like command tokens, e.g. /r year kpop sana 5 image; with --subs: search terms")
     p.add_argument("--subs", "-s", help="Comma-separated subreddits (fallback if not using telegram-like)")
-    p.add_argument("--time", "-t", choices=sorted(VALID_TIMES), help="time_filter for top/search")
-    p.add_argument("--count", "-n", type=int, default=1, help="number of media to download")
-    p.add_argument("--type", choices=sorted(VALID_TYPES), help="media type filter")
-    p.add_argument("--sort", choices=["hot", "top"], default="hot", help="sort mode")
-    p.add_argument("terms", nargs=argparse.REMAINDER, help="search terms (space-separated)")
+    p.add_argument("--time", "-t", choices=sorted(VALID_TIMES), help="time_filter for top/search (with --subs)")
+    p.add_argument("--count", "-n", type=int, help="number of media to download (with --subs; default 1)")
+    p.add_argument("--type", choices=sorted(VALID_TYPES), help="media type filter (with --subs)")
+    p.add_argument("--sort", choices=["hot", "top"], help="sort mode (with --subs; default hot)")
+    p.add_argument("--concurrency", type=int, help="posts to download in parallel (default: config_overrides.DOWNLOAD_CONCURRENCY)")
+    p.add_argument("--blacklist", help="comma-separated title terms to skip (case-insensitive, '_' == ' ')")
+    p.add_argument("--redownload", action="store_true", help="download again even if the file already exists")
+    p.add_argument("--no-outcomes", action="store_true", help="keep only counters, skip the per-item report list")
+    p.add_argument("--cache-ttl", type=float, default=0, help="reuse subreddit listings for this many seconds (0 = off; useful with --daemon)")
+    p.add_argument("--daemon", action="store_true", help="stay running and serve jobs, reusing the Reddit client and HTTP pool")
+    p.add_argument("--remote", action="store_true", help="send this job to a running --daemon instead of running it here")
+    p.add_argument("--combos-file", help="JSONL of jobs, one CLI token list per line; finished lines are recorded in <file>.done and skipped on rerun")
+    p.add_argument("--port", type=int, default=DEFAULT_DAEMON_PORT, help="localhost port for --daemon/--remote")
     return p
 
 
-async def main_async():
-    ap = build_argparser()
-    ns = ap.parse_args()
+def parse_cli(
+    argv: Optional[List[str]] = None,
+    namespace: Optional[argparse.Namespace] = None,
+    raise_on_error: bool = False,
+) -> argparse.Namespace:
+    """
+    Parse CLI args; flags may appear before, between or after the command tokens.
+    raise_on_error=True raises CliArgumentError with argparse's message instead of
+    printing it and exiting (for callers that report errors elsewhere, e.g. the daemon).
+    """
+    return build_argparser(raise_on_error).parse_intermixed_args(argv, namespace)
 
-    if ns.cmd:
-        time_filter, subs, terms, count, mtype, sort = parse_telegramish(ns.cmd)
-    else:
-        subs = [s.strip().lstrip("r/") for s in (ns.subs or "").split(",") if s.strip()]
+
+def pipeline_kwargs(ns: argparse.Namespace) -> Dict[str, Any]:
+    """Resolve parsed CLI args into DownloaderPipeline keyword arguments."""
+    if ns.subs:
+        subs = [s.strip().lstrip("r/") for s in ns.subs.split(",") if s.strip()]
         if not subs:
             raise SystemExit("Provide subreddits via telegram-like tokens or --subs.")
         time_filter = ns.time
-        terms = ns.terms or []
-        count = ns.count
+        terms = list(ns.cmd or [])  # with --subs, the bare words are search terms
+        count = 1 if ns.count is None else ns.count
         mtype = ns.type
-        sort = ("top" if time_filter else ns.sort)
-
-    pipe = DownloaderPipeline(
-        subreddits=subs,
-        search_terms=terms,
-        sort=sort,
-        time_filter=time_filter,
-        media_type=mtype,
-        media_count=count,
-    )
-
-    saved = 0
-    try:
-        saved = await pipe.run()
-    finally:
-        # Extra guard in case pipeline exits early
+        sort = ("top" if time_filter else (ns.sort or "hot"))
+    elif ns.cmd:
+        if ns.time or ns.type or ns.count is not None or ns.sort:
+            raise SystemExit(
+                "--time/--count/--type/--sort only apply with --subs; in command tokens write "
+                "them inline, e.g. /r year kpop sana 5 image"
+            )
+        time_filter, subs, terms, count, mtype, sort = parse_telegramish(ns.cmd)
+    else:
+        raise SystemExit("Provide subreddits via telegram-like tokens or --subs.")
+
+    kwargs: Dict[str, Any] = {
+        "subreddits": dedupe_tokens(subs, "subreddits"),
+        "search_terms": dedupe_tokens(terms, "search terms"),
+        "sort": sort,
+        "time_filter": time_filter,
+        "media_type": mtype,
+        "media_count": count,
+        "collect_outcomes": not ns.no_outcomes,
+        "listing_cache_ttl": ns.cache_ttl,
+        "blacklist_terms": parse_blacklist(ns.blacklist),
+        "skip_existing": not ns.redownload,
+    }
+    if ns.concurrency is not None:  # unset: DownloaderPipeline uses config_overrides
+        kwargs["concurrency"] = ns.concurrency
+    return kwargs
+
+
+def load_combos(path: str) -> List[Tuple[int, str, List[str]]]:
+    """Read (line number, key, argv) jobs from a JSONL file; the stripped line is the resume key."""
+    combos = []
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            key = line.strip()
+            if not key or key.startswith("#"):
+                continue
+            try:
+                argv = json.loads(key)
+            except ValueError as e:
+                raise SystemExit(f"{path}:{lineno}: invalid JSON ({e})")
+            if not isinstance(argv, list):
+                raise SystemExit(f"{path}:{lineno}: each line must be a JSON list of CLI tokens, got: {key}")
+            combos.append((lineno, key, [str(t) for t in argv]))
+    return combos
+
+
+def job_completed(summary) -> bool:
+    """
+    True if a combos job got somewhere: at least one file saved or already on disk.
+    Empty listings (often a transient fetch error) and jobs whose every item failed
+    or was declined by the resolver/downloader stay pending for the next run.
+    """
+    return summary is not None and summary.fetched > 0 and summary.saved + summary.existing > 0
+
+
+def append_done(path: str, key: str) -> None:
+    """Record a finished job; fsync so a crash right after still counts it."""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(key + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+async def run_combos(ns: argparse.Namespace) -> int:
+    """Run every not-yet-done job in ns.combos_file on one shared client."""
+    if ns.cmd or ns.subs or ns.time or ns.type or ns.count is not None or ns.sort:
+        raise SystemExit(
+            "With --combos-file, put subreddits, time, count, type, sort and search terms "
+            "in each job line, not on the command line."
+        )
+
+    from .downloader_pipeline import DownloaderPipeline
+    from ..redditcommand.config import RedditClientManager
+    from ..redditcommand.utils.log_manager import LogManager
+    from ..redditcommand.utils.session import GlobalSession
+
+    logger = LogManager.setup_main_logger()
+    done_path = ns.combos_file + ".done"
+    done = set()
+    if os.path.exists(done_path):
+        with open(done_path, encoding="utf-8") as f:
+            done = set(f.read().splitlines())
+    pending = [job for job in load_combos(ns.combos_file) if job[1] not in done]
+    if done:
+        logger.info(f"Resuming: {len(done)} job(s) already done, {len(pending)} to go")
+
+    # Resolve every job up front so a bad line fails before any download starts
+    jobs = []
+    for lineno, key, argv in pending:
+        # Run-wide flags given alongside --combos-file are defaults; the job line can override them
+        job_ns = argparse.Namespace(**{k: getattr(ns, k) for k in COMBO_RUN_WIDE_OPTIONS})
         try:
-            await GlobalSession.close()
-        except Exception:
-            pass
+            job_ns = parse_cli(argv, namespace=job_ns, raise_on_error=True)
+            kwargs = pipeline_kwargs(job_ns)
+        except CliArgumentError as e:
+            raise SystemExit(f"{ns.combos_file}:{lineno}: {e}")
+        except SystemExit as e:
+            raise SystemExit(f"{ns.combos_file}:{lineno}: {e.code}")
+        jobs.append((key, argv, kwargs))
+
+    seen_urls: set = set()
+    total = 0
+    async with contextlib.AsyncExitStack() as stack:
+        reddit = await RedditClientManager.get_client()
+        # Registered at acquisition; unwound in reverse (session, then client), errors surface
+        stack.push_async_callback(reddit.close)
+        stack.push_async_callback(GlobalSession.close)
+        for i, (key, argv, kwargs) in enumerate(jobs, start=1):
+            pipe = DownloaderPipeline(
+                **kwargs,
+                external_reddit=reddit,
+                external_seen_urls=seen_urls,
+                close_on_exit=False,
+            )
+            saved = await pipe.run()
+            total += saved
+            if job_completed(pipe.last_summary()):
+                append_done(done_path, key)
+                logger.info(f"[{i}/{len(jobs)}] {' '.join(argv)}: saved {saved} (total {total})")
+            else:
+                logger.warning(
+                    f"[{i}/{len(jobs)}] {' '.join(argv)}: nothing saved or on disk; "
+                    f"not marked done, will retry on resume"
+                )
+    return total
+
+
+async def main_async(ns: Optional[argparse.Namespace] = None):
+    if ns is None:
+        ns = parse_cli()
+
+    if ns.daemon:
+        from .daemon import serve
+        await serve(ns.port)
+        return
+
+    if ns.remote:
+        from .daemon import forward
+        reply = await forward(sys.argv[1:], ns.port)
+        if "error" in reply:
+            raise SystemExit(f"Daemon error: {reply['error']}")
+        print("Saved", reply.get("saved", 0), "file(s) to C:\\Reddit")
+        return
+
+    if ns.combos_file:
+        saved = await run_combos(ns)
+        print("Saved", saved, "file(s) to C:\\Reddit")
+        return
+
+    kwargs = pipeline_kwargs(ns)
+
+    # Heavy imports (asyncpraw, telegram, PIL, ...; config_overrides creates the output
+    # folders) only once there is work to do, so --help and argument errors return immediately
+    from .downloader_pipeline import DownloaderPipeline
+    from ..redditcommand.utils.session import GlobalSession
+
+    pipe = DownloaderPipeline(**kwargs)
+
+    async with contextlib.AsyncExitStack() as stack:
+        # Extra guard in case pipeline exits early; close() is a no-op once closed
+        stack.push_async_callback(GlobalSession.close)
+        saved = await pipe.run()
 
     print("Saved", saved, "file(s) to C:\\Reddit")
 
 
 def main():
-    asyncio.run(main_async())
+    ns = parse_cli()
+
+    try:
+        import uvloop  # optional: libuv-backed event loop (not available on Windows)
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    from ..redditcommand.utils.log_manager import LogManager
+
+    LogManager.start_queue_logging()
+    try:
+        asyncio.run(main_async(ns))
+    finally:
+        LogManager.stop_queue_logging()
 
 
 if __name__ == "__main__":
@@ -12,6 +12,8 @@ REPORT_DIR = (OUTPUT_ROOT / "_reports").resolve()
 ENABLE_COMPRESSION = False
 MAX_FILE_SIZE_MB = 5_000
 MAX_FILENAME_LEN = 200
+SKIP_EXISTING = True                 # rerun-friendly: don't re-download files already on disk
+DOWNLOAD_CONCURRENCY = 4             # posts downloaded in parallel per run
 
 OUTPUT_ROOT.mkdir(parents=True, exist_ok=True)
 REPORT_DIR.mkdir(parents=True, exist_ok=True)
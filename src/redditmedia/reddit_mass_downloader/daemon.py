@@ -0,0 +1,110 @@
+# reddit_mass_downloader/daemon.py
+# Long-running job server for the CLI: keeps one Reddit client and the shared
+# aiohttp pool warm between runs. Listens on localhost TCP (works on Windows too).
+# Protocol: one JSON line with the CLI argv in, one JSON line with the result out.
+
+import asyncio
+import contextlib
+import json
+from typing import Any, Dict, List, Set
+
+from .downloader_pipeline import DownloaderPipeline
+from ..redditcommand.config import RedditClientManager, PipelineConfig
+from ..redditcommand.utils.log_manager import LogManager
+from ..redditcommand.utils.session import GlobalSession
+
+logger = LogManager.setup_main_logger()
+
+HOST = "127.0.0.1"
+
+
+async def _run_job(
+    argv: List[str], reddit, lock: asyncio.Lock, seen_urls: Set[str]
+) -> Dict[str, Any]:
+    from .cli import CliArgumentError, parse_cli, pipeline_kwargs
+
+    try:
+        ns = parse_cli(argv, raise_on_error=True)
+        kwargs = pipeline_kwargs(ns)
+    except CliArgumentError as e:
+        return {"error": f"invalid arguments: {e}"}
+    except SystemExit as e:
+        # pipeline_kwargs reports bad combinations as SystemExit(message)
+        return {"error": f"invalid arguments: {e.code}"}
+
+    # One job at a time: jobs share the client, the session and the console
+    async with lock:
+        if len(seen_urls) > PipelineConfig.MAX_PROCESSED_URLS:
+            logger.warning("Seen URL cache exceeded its limit. Resetting.")
+            seen_urls.clear()
+        pipe = DownloaderPipeline(
+            **kwargs,
+            external_reddit=reddit,
+            external_seen_urls=seen_urls,
+            close_on_exit=False,
+        )
+        saved = await pipe.run()
+    return {"saved": saved}
+
+
+async def serve(port: int) -> None:
+    async with contextlib.AsyncExitStack() as stack:
+        reddit = await RedditClientManager.get_client()
+        # Registered at acquisition; unwound in reverse (session, then client), errors surface
+        stack.push_async_callback(reddit.close)
+        stack.push_async_callback(GlobalSession.close)
+        try:
+            # asyncpraw authenticates lazily; take the OAuth round trip now, not on the first job
+            await reddit.user.me()
+        except Exception as e:
+            logger.warning(f"Reddit login warm-up failed (first job will retry): {e}")
+        lock = asyncio.Lock()
+        # Jobs overlap heavily (same subs, related search terms): skip URLs an earlier job saved
+        seen_urls: Set[str] = set()
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            try:
+                argv = json.loads(await reader.readline())
+                reply = await _run_job(argv, reddit, lock, seen_urls)
+            except Exception as e:
+                logger.error(f"Daemon job failed: {e}", exc_info=True)
+                reply = {"error": str(e)}
+            try:
+                writer.write(json.dumps(reply).encode("utf-8") + b"\n")
+                await writer.drain()
+            except ConnectionError as e:
+                logger.warning(f"Client went away before the reply was sent: {e}")
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except ConnectionError:
+                    pass
+
+        server = await stack.enter_async_context(await asyncio.start_server(handle, HOST, port))
+        logger.info(f"Downloader daemon listening on {HOST}:{port}")
+        await server.serve_forever()
+
+
+async def forward(argv: List[str], port: int) -> Dict[str, Any]:
+    try:
+        reader, writer = await asyncio.open_connection(HOST, port)
+    except OSError as e:
+        raise SystemExit(f"No downloader daemon on {HOST}:{port} ({e})")
+    try:
+        writer.write(json.dumps(argv).encode("utf-8") + b"\n")
+        await writer.drain()
+        line = await reader.readline()
+        try:
+            reply = json.loads(line) if line.strip() else None
+        except ValueError:
+            reply = None
+        if not isinstance(reply, dict):
+            raise SystemExit("daemon closed the connection without a reply")
+        return reply
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
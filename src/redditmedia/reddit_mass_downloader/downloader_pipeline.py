@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import asyncio
 import os
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+import time
+from typing import List, Optional, Dict, Any, Set
 
 from asyncpraw import Reddit
 
@@ -12,10 +13,18 @@ from ..redditcommand.config import RedditClientManager
 from ..redditcommand.utils.log_manager import LogManager
 from ..redditcommand.fetch import MediaPostFetcher
 from ..redditcommand.utils.session import GlobalSession
+from ..redditcommand.utils.media_utils import MediaDownloader
 
 from .local_media_handler import LocalMediaSaver
-from .config_overrides import REPORT_DIR, OUTPUT_ROOT, WRITE_RUN_REPORT_JSON
+from .config_overrides import (
+    REPORT_DIR,
+    OUTPUT_ROOT,
+    WRITE_RUN_REPORT_JSON,
+    DOWNLOAD_CONCURRENCY,
+    SKIP_EXISTING,
+)
 from .filename_utils import slugify_title
+from .json_utils import dumps_pretty, write_bytes_atomic
 
 logger = LogManager.setup_main_logger()
 
@@ -27,6 +36,10 @@ class RunSummary:
     skipped: int
     failed: int
     outcomes: List[Dict[str, Any]]
+    existing: int = 0                               # of skipped: already on disk
+    outcomes_omitted: bool = False
+    timings: Optional[Dict[str, float]] = None      # stage -> seconds
+    http_retries: Optional[Dict[int, int]] = None   # retryable status -> hits this run
 
 
 class DownloaderPipeline:
@@ -47,8 +60,13 @@ class DownloaderPipeline:
         blacklist_terms: Optional[List[str]] = None,
         close_on_exit: bool = True,                  # keep False when looping
         external_reddit: Optional[Reddit] = None,    # inject shared client
+        external_seen_urls: Optional[Set[str]] = None,  # share across runs to skip URLs already saved
         write_report: bool = True,                   # allow caller to suppress per-run JSON
         dry_run: bool = False,                       # NEW: metadata-only; do not download
+        collect_outcomes: bool = True,               # False: keep counters only, no per-item list
+        listing_cache_ttl: Optional[float] = None,   # seconds; None uses ListingCacheConfig
+        concurrency: int = DOWNLOAD_CONCURRENCY,     # posts saved in parallel
+        skip_existing: bool = SKIP_EXISTING,         # False: re-download files already on disk
     ):
         self.subreddits = subreddits
         self.search_terms = search_terms or []
@@ -64,18 +82,43 @@ class DownloaderPipeline:
         self.fetcher: Optional[MediaPostFetcher] = None
 
         self._owns_reddit = external_reddit is None
+        self.seen_urls: Set[str] = external_seen_urls if external_seen_urls is not None else set()
         self.close_on_exit = close_on_exit
         self.write_report = write_report
+        self.collect_outcomes = collect_outcomes
+        self.concurrency = concurrency
+        self.skip_existing = skip_existing
+        self.listing_cache_ttl = listing_cache_ttl
         # Allow env override so callers don't need to plumb the arg
         self.dry_run = bool(dry_run or (os.getenv("RMD_DRY_RUN", "").strip() == "1"))
 
         self._last_summary: Optional[RunSummary] = None
+        self._timings: Dict[str, float] = {}
+        self._retries_before: Dict[int, int] = {}
+        self._started = 0.0
 
     async def run(self) -> int:
-        saved_count = 0
         outcomes: List[Dict[str, Any]] = []
+        tally: Dict[str, int] = {}
+
+        def record(outcome: Dict[str, Any]) -> None:
+            status = outcome["status"]
+            tally[status] = tally.get(status, 0) + 1
+            if outcome.get("existing"):
+                tally["existing"] = tally.get("existing", 0) + 1
+            if self.collect_outcomes:
+                outcomes.append(outcome)
+
+        prewarm: Optional[asyncio.Task] = None
+        self._timings = {}
+        self._retries_before = dict(MediaDownloader.retry_counts)
+        self._started = time.perf_counter()
 
         try:
+            # Warm media-host DNS/TLS while the listing fetch is in flight
+            if not self.dry_run:
+                prewarm = asyncio.create_task(GlobalSession.prewarm())
+
             # 1) Get or reuse Reddit client
             if self.reddit is None:
                 self.reddit = await RedditClientManager.get_client()
@@ -98,13 +141,15 @@ class DownloaderPipeline:
                 blacklist_terms=self.blacklist_terms,
                 update=None,
                 invalid_subreddits=set(),
-                processed_urls=set(),
+                processed_urls=self.seen_urls,
+                listing_cache_ttl=self.listing_cache_ttl,
             )
+            self._timings["fetch"] = round(time.perf_counter() - self._started, 3)
 
             if not posts:
                 logger.info("No posts fetched by downloader pipeline.")
-                summary = self._build_summary(outcomes, fetched=0)
-                self._finalize_report(summary)
+                summary = self._build_summary(outcomes, tally, fetched=0)
+                await self._finalize_report(summary)
                 return 0
 
             # Build collection folder from subreddit + search terms
@@ -117,127 +162,198 @@ class DownloaderPipeline:
             # If dry-run, skip creating saver and only collect metadata
             saver: Optional[LocalMediaSaver] = None
             if not self.dry_run:
-                saver = LocalMediaSaver(self.reddit, collection_label=collection_label)
+                saver = LocalMediaSaver(
+                    self.reddit,
+                    collection_label=collection_label,
+                    skip_existing=self.skip_existing,
+                )
                 await saver._ensure_ready()
 
-            for post in posts:
-                post_info = {
-                    "id": getattr(post, "id", None),
-                    "subreddit": getattr(getattr(post, "subreddit", None), "display_name", None),
-                    "title": getattr(post, "title", None),
-                    "url": getattr(post, "url", None),
-                    "score": getattr(post, "score", None),          # <-- NEW: include score in report
-                    # (optional extras if you want them, uncomment as needed)
-                    "upvote_ratio": getattr(post, "upvote_ratio", None),
-                    "num_comments": getattr(post, "num_comments", None),
-                    "created_utc": getattr(post, "created_utc", None),
-                }
+            if self.dry_run:
                 # Dry-run: record only metadata, mark status as 'listed'
-                if self.dry_run:
-                    outcomes.append({**post_info, "status": "listed"})
-                    continue
-
+                for post in posts:
+                    record(self._outcome(post, "listed"))
+            else:
+                sem = asyncio.Semaphore(max(1, self.concurrency))
+
+                async def save_bounded(idx: int, post) -> tuple[int, List[Dict[str, Any]]]:
+                    async with sem:
+                        return idx, await self._save_one(saver, post)  # type: ignore[arg-type]
+
+                save_started = time.perf_counter()
+                tasks = [asyncio.create_task(save_bounded(i, p)) for i, p in enumerate(posts)]
+                results: List[List[Dict[str, Any]]] = [[] for _ in posts]
                 try:
-                    result = await saver.save_post(post)  # type: ignore[union-attr]
-                    if isinstance(result, list):
-                        if result:
-                            saved_count += len(result)
-                            for p in result:
-                                outcomes.append({**post_info, "status": "saved", "path": str(p)})
-                        else:
-                            outcomes.append({
-                                **post_info,
-                                "status": "failed",
-                                "reason": "gallery had 0 valid items (no usable media_metadata)",
-                            })
-                    elif result:
-                        saved_count += 1
-                        outcomes.append({**post_info, "status": "saved", "path": str(result)})
-                    else:
-                        # Resolver returned no URL (e.g., transient Redgifs outage, unsupported host, etc.)
-                        # Treat as SKIPPED so flaky upstreams don’t count as failures.
-                        outcomes.append({
-                            **post_info,
-                            "status": "skipped",
-                            "reason": "resolver returned no URL (transient/unavailable or declined)",
-                        })
-
-                except FileNotFoundError as e:
-                    outcomes.append({**post_info, "status": "failed", "reason": str(e)})
-                    logger.info(f"{post_info['id']}: {e}")
-
-                except FileExistsError as e:
-                    outcomes.append({**post_info, "status": "skipped", "reason": str(e)})
-                    logger.info(f"Skipped existing: {post_info['id']}: {e}")
-
-                except Exception as e:
-                    outcomes.append({**post_info, "status": "failed", "reason": str(e)})
-                    logger.error(f"Error saving post {post_info['id']}: {e}", exc_info=True)
-
-            summary = self._build_summary(outcomes, fetched=len(posts))
-            self._finalize_report(summary)
-            return saved_count
+                    # Report progress as each save finishes, not in submission order
+                    for done, fut in enumerate(asyncio.as_completed(tasks), start=1):
+                        idx, post_outcomes = await fut
+                        results[idx] = post_outcomes
+                        statuses = ", ".join(o["status"] for o in post_outcomes)
+                        logger.info(f"[{done}/{len(posts)}] {getattr(posts[idx], 'id', None)}: {statuses}")
+                finally:
+                    # Ctrl-C / cancellation: stop outstanding saves before cleanup runs
+                    for t in tasks:
+                        t.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+
+                self._timings["save"] = round(time.perf_counter() - save_started, 3)
+
+                # Outcomes are still recorded in listing order
+                for post, post_outcomes in zip(posts, results):
+                    for outcome in post_outcomes:
+                        record(outcome)
+                    # Later runs sharing this set skip only posts that are on disk;
+                    # failed / resolver-declined posts stay eligible for a retry
+                    url = getattr(post, "url", None)
+                    if url and any(o["status"] == "saved" or o.get("existing") for o in post_outcomes):
+                        self.seen_urls.add(url)
+
+            summary = self._build_summary(outcomes, tally, fetched=len(posts))
+            await self._finalize_report(summary)
+            return tally.get("saved", 0)
 
         finally:
+            if prewarm is not None and not prewarm.done():
+                prewarm.cancel()
             if self.close_on_exit:
-                try:
-                    await GlobalSession.close()
-                except Exception:
-                    pass
+                closers = [GlobalSession.close()]
                 # Only close reddit if we created it here
-                if self._owns_reddit:
-                    try:
-                        if self.reddit is not None and hasattr(self.reddit, "close"):
-                            await self.reddit.close()
-                    except Exception:
-                        pass
+                if self._owns_reddit and self.reddit is not None and hasattr(self.reddit, "close"):
+                    closers.append(self.reddit.close())
+                # Tear down both concurrently; a failing close must not mask the run result
+                for res in await asyncio.gather(*closers, return_exceptions=True):
+                    if isinstance(res, Exception):
+                        logger.debug(f"Cleanup error ignored: {res}")
 
     def last_summary(self) -> Optional[RunSummary]:
         return self._last_summary
 
     # ---- helpers -------------------------------------------------------------
 
-    def _build_summary(self, outcomes: List[Dict[str, Any]], fetched: int) -> RunSummary:
-        saved = sum(1 for o in outcomes if o["status"] == "saved")
-        skipped = sum(1 for o in outcomes if o["status"] == "skipped")
-        failed = sum(1 for o in outcomes if o["status"] == "failed")
-        return RunSummary(fetched=fetched, saved=saved, skipped=skipped, failed=failed, outcomes=outcomes)
+    @staticmethod
+    def _outcome(post, status: str, **extra: Any) -> Dict[str, Any]:
+        """Build one report record in place (no per-outcome {**post_info} copy)."""
+        outcome = {
+            "id": getattr(post, "id", None),
+            "subreddit": getattr(getattr(post, "subreddit", None), "display_name", None),
+            "title": getattr(post, "title", None),
+            "url": getattr(post, "url", None),
+            "score": getattr(post, "score", None),          # <-- NEW: include score in report
+            # (optional extras if you want them, uncomment as needed)
+            "upvote_ratio": getattr(post, "upvote_ratio", None),
+            "num_comments": getattr(post, "num_comments", None),
+            "created_utc": getattr(post, "created_utc", None),
+            "status": status,
+        }
+        outcome.update(extra)
+        return outcome
+
+    async def _save_one(self, saver: LocalMediaSaver, post) -> List[Dict[str, Any]]:
+        """Save one post and return its outcome record(s); never raises."""
+        post_id = getattr(post, "id", None)
+        try:
+            result = await saver.save_post(post)
+            if isinstance(result, list):
+                if result:
+                    return [self._outcome(post, "saved", path=str(p)) for p in result]
+                return [self._outcome(
+                    post, "failed",
+                    reason="gallery had 0 valid items (no usable media_metadata)",
+                )]
+            if result:
+                return [self._outcome(post, "saved", path=str(result))]
+            # Resolver returned no URL (e.g., transient Redgifs outage, unsupported host, etc.)
+            # Treat as SKIPPED so flaky upstreams don’t count as failures.
+            return [self._outcome(
+                post, "skipped",
+                reason="resolver returned no URL (transient/unavailable or declined)",
+            )]
+
+        except FileNotFoundError as e:
+            logger.info(f"{post_id}: {e}")
+            return [self._outcome(post, "failed", reason=str(e))]
+
+        except FileExistsError as e:
+            logger.info(f"Skipped existing: {post_id}: {e}")
+            return [self._outcome(post, "skipped", reason=str(e), existing=True)]
+
+        except Exception as e:
+            logger.error(f"Error saving post {post_id}: {e}", exc_info=True)
+            return [self._outcome(post, "failed", reason=str(e))]
+
+    def _build_summary(
+        self, outcomes: List[Dict[str, Any]], tally: Dict[str, int], fetched: int
+    ) -> RunSummary:
+        return RunSummary(
+            fetched=fetched,
+            saved=tally.get("saved", 0),
+            skipped=tally.get("skipped", 0),
+            failed=tally.get("failed", 0),
+            outcomes=outcomes,
+            existing=tally.get("existing", 0),
+            outcomes_omitted=not self.collect_outcomes,
+            timings={**self._timings, "total": round(time.perf_counter() - self._started, 3)},
+            http_retries={
+                status: n - self._retries_before.get(status, 0)
+                for status, n in MediaDownloader.retry_counts.items()
+                if n > self._retries_before.get(status, 0)
+            },
+        )
 
     def _print_summary(self, s: RunSummary) -> None:
-        print()
-        print("=== Download Report ===")
-        print(f"Fetched posts: {s.fetched}")
-        print(f"Saved: {s.saved}")
-        print(f"Skipped (exists): {s.skipped}")
-        print(f"Failed: {s.failed}")
-        if s.failed:
-            print("\nFailures (id → reason):")
-            for o in (x for x in s.outcomes if x["status"] == "failed"):
-                print(f" - {o.get('id')}: {o.get('reason')}")
+        # One record through the logger: written by the queue listener thread, off the event loop
+        lines = [
+            "=== Download Report ===",
+            f"Fetched posts: {s.fetched}",
+            f"Saved: {s.saved}",
+            f"Skipped: {s.skipped} (already on disk: {s.existing})",
+            f"Failed: {s.failed}",
+        ]
+        if s.timings:
+            lines.append("Timings: " + ", ".join(f"{k} {v:.1f}s" for k, v in s.timings.items()))
+        if s.http_retries:
+            lines.append("HTTP retries: " + ", ".join(f"{k}×{v}" for k, v in sorted(s.http_retries.items())))
+        if s.failed and not s.outcomes_omitted:
+            lines.append("Failures (id → reason):")
+            lines.extend(
+                f" - {o.get('id')}: {o.get('reason')}"
+                for o in s.outcomes if o["status"] == "failed"
+            )
+        logger.info("\n".join(lines))
 
     def _write_report(self, s: RunSummary) -> None:
         try:
             REPORT_DIR.mkdir(parents=True, exist_ok=True)  # ensure dir exists
-            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            ts = time.strftime("%Y%m%d_%H%M%S")
             report_path = REPORT_DIR / f"report_{ts}.json"
-            import json  # local import to avoid import at module load time
-            data = {
+            # Back-to-back runs (batch jobs, daemon) can finish within the same second
+            n = 1
+            while report_path.exists():
+                report_path = REPORT_DIR / f"report_{ts}_{n}.json"
+                n += 1
+            data: Dict[str, Any] = {
                 "root": str(OUTPUT_ROOT),
                 "fetched": s.fetched,
                 "saved": s.saved,
                 "skipped": s.skipped,
+                "existing": s.existing,
                 "failed": s.failed,
-                "outcomes": s.outcomes,
-                "created_at": ts,
+                "timings": s.timings or {},
+                "http_retries": s.http_retries or {},
             }
-            with open(report_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"\nReport written to: {report_path}")
+            if s.outcomes_omitted:
+                data["outcomes_omitted"] = True
+            else:
+                data["outcomes"] = s.outcomes
+            data["created_at"] = ts
+            write_bytes_atomic(report_path, dumps_pretty(data))
+            logger.info(f"Report written to: {report_path}")
         except Exception as e:
             logger.warning(f"Could not write report JSON: {e}")
 
-    def _finalize_report(self, summary: RunSummary) -> None:
+    async def _finalize_report(self, summary: RunSummary) -> None:
         self._last_summary = summary
         self._print_summary(summary)
         if self.write_report and WRITE_RUN_REPORT_JSON:
-            self._write_report(summary)
+            # JSON encoding + disk write off the event loop thread
+            await asyncio.to_thread(self._write_report, summary)
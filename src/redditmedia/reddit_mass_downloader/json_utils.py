@@ -0,0 +1,30 @@
+# reddit_mass_downloader/json_utils.py
+
+import os
+from pathlib import Path
+
+from ..redditcommand.utils.json_utils import dumps_pretty  # noqa: F401  (shared orjson shim)
+
+
+def write_bytes(path: Path, buf: bytes) -> None:
+    """Write the whole buffer with raw os.write calls (normally a single syscall)."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(str(path), flags, 0o644)
+    try:
+        mv = memoryview(buf)
+        written = 0
+        while written < len(mv):
+            written += os.write(fd, mv[written:])
+    finally:
+        os.close(fd)
+
+
+def write_bytes_atomic(path: Path, buf: bytes) -> None:
+    """Write to a sibling .tmp file, then os.replace() it so readers never see a partial file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        write_bytes(tmp, buf)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
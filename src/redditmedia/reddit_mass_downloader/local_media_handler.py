@@ -1,12 +1,10 @@
 # reddit_mass_downloader/local_media_handler.py
 
-import json
 from urllib.parse import urlparse
 import re
 import os
 import time
 import shutil
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple, List, Union
 import html
@@ -15,6 +13,7 @@ from asyncpraw import Reddit
 from asyncpraw.models import Submission
 
 from .filename_utils import build_filename_clamped
+from .json_utils import dumps_pretty, write_bytes
 from .config_overrides import (
     OUTPUT_ROOT,
     WRITE_SUBREDDIT_MANIFEST,
@@ -22,6 +21,7 @@ from .config_overrides import (
     ENABLE_COMPRESSION,
     MAX_FILE_SIZE_MB,
     MAX_FILENAME_LEN,  # NEW
+    SKIP_EXISTING,
 )
 
 from ..redditcommand.utils.media_utils import MediaDownloader, MediaUtils
@@ -29,6 +29,10 @@ from ..redditcommand.handle_direct_link import MediaLinkResolver
 from ..redditcommand.utils.compressor import Compressor
 
 
+# Final extensions a non-gallery save can end up with (gif is converted to mp4)
+_SAVED_MEDIA_EXTS = (".mp4", ".jpg", ".jpeg", ".png", ".webm", ".gifv")
+
+
 def _ext_from_mime(m: Optional[str]) -> str:
     if not m:
         return ""
@@ -58,11 +62,18 @@ class LocalMediaSaver:
       - downloads to C:\\Reddit\\<subreddit or collection_label>\\, writes JSON sidecar (+ manifest)
       - includes top comment (text + author) in the metadata
     """
-    def __init__(self, reddit: Reddit, root: Path = OUTPUT_ROOT, collection_label: Optional[str] = None):
+    def __init__(
+        self,
+        reddit: Reddit,
+        root: Path = OUTPUT_ROOT,
+        collection_label: Optional[str] = None,
+        skip_existing: bool = SKIP_EXISTING,
+    ):
         self.root = root
         self.reddit = reddit
         self.resolver = MediaLinkResolver()
         self.collection_label = collection_label
+        self.skip_existing = skip_existing
 
     async def _ensure_ready(self):
         await self.resolver.init()
@@ -75,13 +86,33 @@ class LocalMediaSaver:
         p.mkdir(parents=True, exist_ok=True)
         return p
 
-    @staticmethod
-    def _created_str(post: Submission) -> str:
-        try:
-            dt = datetime.fromtimestamp(int(post.created_utc), tz=timezone.utc)
-            return dt.strftime("%Y%m%d_%H%M%S")
-        except Exception:
-            return "00000000_000000"
+    def _existing_target(self, target: Path) -> Optional[Path]:
+        """Return the already-saved file for this target (gif targets end up as .mp4), if any."""
+        if not self.skip_existing:
+            return None
+        candidates = [target]
+        if target.suffix.lower() == ".gif":
+            candidates.append(target.with_suffix(".mp4"))
+        for candidate in candidates:
+            if candidate.exists():
+                return candidate
+        return None
+
+    def _existing_for_post(self, post: Submission) -> Optional[Path]:
+        """
+        Look for a saved single-media file for this post under any extension the
+        resolvers produce, so reruns can skip it before resolve() downloads anything.
+        """
+        if not self.skip_existing:
+            return None
+        sub = getattr(post.subreddit, "display_name", "unknown")
+        subdir = self._subdir(sub)
+        title = getattr(post, "title", "") or ""
+        for ext in _SAVED_MEDIA_EXTS:
+            candidate = subdir / build_filename_clamped(sub, title, post.id, ext, max_name_len=MAX_FILENAME_LEN)
+            if candidate.exists():
+                return candidate
+        return None
 
     # --- NEW: robust finalization for Windows locks (AV/indexer) ---
     async def _finalize_tmp(self, tmp_path: Path, final_path: Path, *, attempts: int = 5, delay_sec: float = 0.2) -> bool:
@@ -328,6 +359,12 @@ class LocalMediaSaver:
             items = await self._resolve_gallery_items(post)
             return items or None
 
+        # Most resolvers (v.redd.it, redgifs, streamable, imgur, yt-dlp) download the
+        # whole file, so an already-saved post has to be caught before resolve()
+        existing = self._existing_for_post(post)
+        if existing is not None:
+            raise FileExistsError(f"already saved: {existing}")
+
         # Delegate ALL normalization to the resolver
         return await self.resolver.resolve(url, post=post)
 
@@ -343,11 +380,15 @@ class LocalMediaSaver:
         # --- GALLERY CASE: list of (url, ext) ---
         if isinstance(resolved, list):
             saved_paths: List[Path] = []
+            already_saved = 0
             total = len(resolved)
             for i, (item_url, item_ext) in enumerate(resolved, start=1):
                 paths = self._build_paths(post, item_url, index=i, override_ext=item_ext)
 
                 target_media = paths["media"]
+                if self._existing_target(target_media) is not None:
+                    already_saved += 1
+                    continue
                 tmp_media = target_media.with_suffix(target_media.suffix + ".tmp")
                 try:
                     if tmp_media.exists():
@@ -401,8 +442,7 @@ class LocalMediaSaver:
                     meta_path = target_media.with_suffix(target_media.suffix + ".json")
                     tmp_meta = meta_path.with_suffix(meta_path.suffix + ".tmp")
                     try:
-                        with open(tmp_meta, "w", encoding="utf-8") as f:
-                            json.dump(meta, f, ensure_ascii=False, indent=2)
+                        write_bytes(tmp_meta, dumps_pretty(meta))
                         await self._finalize_tmp(tmp_meta, meta_path)
                     finally:
                         try:
@@ -416,12 +456,23 @@ class LocalMediaSaver:
 
                 saved_paths.append(target_media)
 
+            if not saved_paths and already_saved:
+                raise FileExistsError(f"all {already_saved} gallery item(s) already saved")
             return saved_paths or None
 
         # --- NON-GALLERY CASE: existing logic for a single URL ---
         paths = self._build_paths(post, resolved)
 
         target_media = paths["media"]
+        existing = self._existing_target(target_media)
+        if existing is not None:
+            # Resolver may have already fetched to a local temp file; drop it
+            if os.path.isfile(resolved) and not resolved.lower().startswith(("http://", "https://")):
+                try:
+                    os.remove(resolved)
+                except Exception:
+                    pass
+            raise FileExistsError(f"already saved: {existing}")
         tmp_media = target_media.with_suffix(target_media.suffix + ".tmp")
         try:
             if tmp_media.exists():
@@ -474,8 +525,7 @@ class LocalMediaSaver:
             meta_path = target_media.with_suffix(target_media.suffix + ".json")
             tmp_meta = meta_path.with_suffix(meta_path.suffix + ".tmp")
             try:
-                with open(tmp_meta, "w", encoding="utf-8") as f:
-                    json.dump(meta, f, ensure_ascii=False, indent=2)
+                write_bytes(tmp_meta, dumps_pretty(meta))
                 await self._finalize_tmp(tmp_meta, meta_path)
             finally:
                 try:
@@ -53,14 +53,31 @@ class RedditClientManager:
 class TimeoutConfig:
     DOWNLOAD_TIMEOUT = 300
 
+class ListingCacheConfig:
+    TTL_SECONDS = 0  # 0 = off; in-process reuse of subreddit listings
+
+class SessionConfig:
+    CONNECTOR_LIMIT = 100
+    CONNECTOR_LIMIT_PER_HOST = 32
+    DNS_CACHE_TTL_SECONDS = 300
+    KEEPALIVE_TIMEOUT_SECONDS = 75
+    PREWARM_URLS = ("https://i.redd.it/", "https://v.redd.it/")
+    PREWARM_TIMEOUT_SECONDS = 5
+
 class RetryConfig:
     RETRY_ATTEMPTS = 1
+    DOWNLOAD_ATTEMPTS = 4
+    DOWNLOAD_BACKOFF_BASE_SECONDS = 0.5
+    DOWNLOAD_BACKOFF_MAX_SECONDS = 30
+    RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
 
 class MediaConfig:
     MAX_FILE_SIZE_MB = 50
     DEFAULT_SEMAPHORE_LIMIT = 10
     MAX_MEDIA_COUNT = 10
     POST_LIMIT = 250
+    DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+    SINGLE_READ_MAX_BYTES = 8 * 1024 * 1024  # known-size bodies up to this are read in one await
 
 class PipelineConfig:
     INITIAL_BACKOFF_SECONDS = 1.0
@@ -2,12 +2,13 @@
 
 import asyncio
 import random
-from typing import Optional, List, Set
+from typing import Optional, List, Set, Tuple
 from asyncpraw.models import Submission
 
 from .config import RedditClientManager, MediaConfig, RedditDefaults
 from .filter_posts import MediaPostFilter
 from .utils.fetch_utils import RedditPostFetcher, FetchOrchestrator
+from .utils.filter_utils import FilterUtils
 from .utils.log_manager import LogManager
 
 logger = LogManager.setup_main_logger()
@@ -36,11 +37,13 @@ class MediaPostFetcher:
         update=None,
         invalid_subreddits: Optional[Set[str]] = None,
         processed_urls: Optional[Set[str]] = None,
+        listing_cache_ttl: Optional[float] = None,
     ) -> List[Submission]:
         await self.init_client()
 
         invalid_subreddits = invalid_subreddits or set()
-        processed_urls = processed_urls or set()
+        # Keep a caller's (possibly empty) set so URLs seen here carry over to its next call
+        processed_urls = processed_urls if processed_urls is not None else set()
         processed_post_ids = set()
         media_posts: List[Submission] = []
 
@@ -51,6 +54,9 @@ class MediaPostFetcher:
 
         random.shuffle(valid_subreddits)
 
+        # Normalize the blacklist once for every subreddit task below
+        compiled_blacklist = FilterUtils.compile_blacklist(blacklist_terms)
+
         n = len(valid_subreddits)
         requested_total = max(0, media_count)
 
@@ -78,6 +84,8 @@ class MediaPostFetcher:
                     min_score=min_score,
                     pick_mode=pick_mode,
                     blacklist_terms=blacklist_terms,
+                    compiled_blacklist=compiled_blacklist,
+                    listing_cache_ttl=listing_cache_ttl,
                 )
                 for s in subs_to_fetch
             ]
@@ -154,6 +162,8 @@ class MediaPostFetcher:
         min_score: Optional[int],
         pick_mode: str,
         blacklist_terms: Optional[List[str]],
+        compiled_blacklist: Optional[Tuple[Tuple[str, str], ...]] = None,
+        listing_cache_ttl: Optional[float] = None,
     ) -> List[Submission]:
         async with self.semaphore:
             try:
@@ -163,7 +173,8 @@ class MediaPostFetcher:
                     search_terms=search_terms,
                     sort=sort,
                     time_filter=time_filter,
-                    update=update
+                    update=update,
+                    cache_ttl=listing_cache_ttl,
                 )
 
                 if not posts:
@@ -178,6 +189,7 @@ class MediaPostFetcher:
                     min_score=min_score,
                     pick_mode=pick_mode,
                     blacklist_terms=blacklist_terms,
+                    compiled_blacklist=compiled_blacklist,
                 )
                 filtered = await filterer.filter(posts)
                 unique = await RedditPostFetcher.filter_duplicates(filtered, processed_post_ids)
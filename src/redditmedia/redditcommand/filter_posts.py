@@ -1,7 +1,7 @@
 # redditmedia/redditcommand/filter_posts.py
 
 from random import sample
-from typing import List, Optional, Set
+from typing import List, Optional, Set, Tuple
 from asyncpraw.models import Submission
 
 from .utils.log_manager import LogManager
@@ -21,13 +21,20 @@ class MediaPostFilter:
         min_score: Optional[int] = None,
         blacklist_terms: Optional[List[str]] = None,
         pick_mode: str = "top",
+        compiled_blacklist: Optional[Tuple[Tuple[str, str], ...]] = None,
     ):
         self.subreddit_name = subreddit_name
         self.media_type = media_type
         self.media_count = media_count
-        self.processed_urls = processed_urls or set()
+        self.processed_urls = processed_urls if processed_urls is not None else set()
         self.min_score = min_score
         self.blacklist_terms = blacklist_terms or []
+        # Callers filtering many subreddits pass the blacklist pre-compiled once
+        self.compiled_blacklist = (
+            compiled_blacklist
+            if compiled_blacklist is not None
+            else FilterUtils.compile_blacklist(self.blacklist_terms)
+        )
         self.pick_mode = (pick_mode or "top").lower()
 
     async def filter(self, posts: List[Submission]) -> List[Submission]:
@@ -52,7 +59,7 @@ class MediaPostFilter:
                 self.processed_urls,
                 self.media_type,
                 min_score=self.min_score,
-                blacklist_terms=self.blacklist_terms,
+                compiled_blacklist=self.compiled_blacklist,
             )
             if reason:
                 skipped[reason] += 1
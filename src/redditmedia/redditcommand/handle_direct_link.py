@@ -19,6 +19,7 @@ from .utils.tempfile_utils import TempFileManager
 from .utils.media_utils import MediaDownloader, AVMuxer
 from .utils.reddit_video_resolver import RedditVideoResolver
 from .utils.session import GlobalSession
+from .utils.json_utils import loads as json_loads
 from .utils.name_utils import (
     temp_paths_for_vreddit,
     temp_path_for_generic,
@@ -286,7 +287,7 @@ class MediaLinkResolver:
                 if resp.status != 200:
                     logger.info(f"Streamable API returned {resp.status} for {shortcode}")
                     return None
-                data = await resp.json()
+                data = await resp.json(loads=json_loads)
 
             files = data.get("files", {}) or {}
             path = None
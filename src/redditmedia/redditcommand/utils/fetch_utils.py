@@ -1,9 +1,10 @@
 import asyncio
 import random
-from typing import List, Optional, Set, Tuple
+import time
+from typing import Dict, List, Optional, Set, Tuple
 from asyncpraw.models import Subreddit, Submission
 
-from ..config import RedditClientManager, MediaConfig, Messages
+from ..config import RedditClientManager, MediaConfig, Messages, ListingCacheConfig
 from .log_manager import LogManager
 
 logger = LogManager.setup_main_logger()
@@ -188,9 +189,63 @@ class RandomSearch:
             return [], None
 
 
+class ListingCache:
+    """
+    In-process TTL cache of raw subreddit listings keyed by query parameters.
+    Pays off in long-lived processes (bot, downloader daemon) that repeat queries.
+    Callers may pass their own ttl; None falls back to the process-wide ttl_seconds.
+    """
+    ttl_seconds: float = ListingCacheConfig.TTL_SECONDS
+    # key -> (stored_at, ttl, posts, display_name)
+    _entries: Dict[Tuple, Tuple[float, float, List[Submission], Optional[str]]] = {}
+
+    @staticmethod
+    def key(subreddit_name: str, search_terms, sort, time_filter) -> Tuple:
+        terms = tuple(t.strip().lower() for t in (search_terms or []) if t.strip())
+        return (subreddit_name.lower(), terms, sort, time_filter)
+
+    @classmethod
+    def get(cls, key: Tuple, ttl: Optional[float] = None) -> Optional[Tuple[List[Submission], Optional[str]]]:
+        ttl = cls.ttl_seconds if ttl is None else ttl
+        if ttl <= 0:
+            return None
+        hit = cls._entries.get(key)
+        if hit is None:
+            return None
+        stored_at, entry_ttl, posts, display_name = hit
+        age = time.monotonic() - stored_at
+        if age > entry_ttl:
+            del cls._entries[key]
+            return None
+        if age > ttl:
+            return None
+        return list(posts), display_name
+
+    @classmethod
+    def put(cls, key: Tuple, posts: List[Submission], display_name: Optional[str], ttl: Optional[float] = None) -> None:
+        ttl = cls.ttl_seconds if ttl is None else ttl
+        if ttl <= 0 or not posts:
+            return
+        now = time.monotonic()
+        # Drop expired entries so a long-lived process with varied queries doesn't grow forever
+        for k in [k for k, (stored_at, entry_ttl, _, _) in cls._entries.items() if now - stored_at > entry_ttl]:
+            del cls._entries[k]
+        cls._entries[key] = (now, ttl, list(posts), display_name)
+
+
 class FetchOrchestrator:
     @staticmethod
-    async def get_posts(reddit, subreddit_name: str, search_terms, sort, time_filter, update) -> Tuple[List[Submission], Optional[str]]:
+    async def get_posts(
+        reddit, subreddit_name: str, search_terms, sort, time_filter, update, cache_ttl: Optional[float] = None
+    ) -> Tuple[List[Submission], Optional[str]]:
+        cache_key = None
+        if subreddit_name.lower() != "random":
+            cache_key = ListingCache.key(subreddit_name, search_terms, sort, time_filter)
+            cached = ListingCache.get(cache_key, cache_ttl)
+            if cached is not None:
+                logger.info(f"Listing cache hit for r/{subreddit_name}")
+                return cached
+
         if subreddit_name.lower() == "random":
             posts, subreddit = await RandomSearch.run(reddit, search_terms, sort, time_filter, update)
         else:
@@ -204,4 +259,6 @@ class FetchOrchestrator:
                 posts = await RedditPostFetcher.fetch_sorted(subreddit, sort, time_filter)
 
         display_name = getattr(subreddit, "display_name", None)
+        if cache_key is not None:
+            ListingCache.put(cache_key, posts, display_name, cache_ttl)
         return posts, display_name
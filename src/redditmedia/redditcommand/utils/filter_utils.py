@@ -1,7 +1,7 @@
 # redditcommand/utils/filter_utils.py
 
 import re
-from typing import Optional, Set, List
+from typing import Optional, Set, List, Tuple
 from asyncpraw.models import Submission
 
 from .url_utils import is_valid_media_url, matches_media_type
@@ -12,6 +12,8 @@ logger = LogManager.setup_main_logger()
 skip_logger = LogManager.get_skip_logger()
 accepted_logger = LogManager.get_accepted_logger()
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class FilterUtils:
     @staticmethod
@@ -37,6 +39,19 @@ class FilterUtils:
             f"Upvotes: {post.score} | Author: {post.metadata['author']} | Media URL: {post.url} | Post Link: https://reddit.com/comments/{post.id}"
         )
 
+    @staticmethod
+    def compile_blacklist(blacklist_terms: Optional[List[str]]) -> Tuple[Tuple[str, str], ...]:
+        """
+        Normalize blacklist terms once into (casefolded term, term with "_" as spaces) pairs
+        so should_skip() doesn't redo it for every post.
+        """
+        compiled = []
+        for raw in blacklist_terms or []:
+            term = (raw or "").casefold().strip()
+            if term:
+                compiled.append((term, term.replace("_", " ")))
+        return tuple(compiled)
+
     @staticmethod
     def should_skip( 
         post: Submission,
@@ -44,10 +59,13 @@ class FilterUtils:
         media_type: Optional[str],
         min_score: Optional[int] = None,
         blacklist_terms: Optional[List[str]] = None,
+        compiled_blacklist: Optional[Tuple[Tuple[str, str], ...]] = None,
     ) -> Optional[str]:
         url = post.url or ""
         reason = None
         title = (getattr(post, "title", "") or "").casefold()
+        if compiled_blacklist is None and blacklist_terms:
+            compiled_blacklist = FilterUtils.compile_blacklist(blacklist_terms)
 
         if not url or not is_valid_media_url(url):
             reason = SkipReasons.NON_MEDIA
@@ -59,20 +77,13 @@ class FilterUtils:
             reason = SkipReasons.WRONG_TYPE
         elif min_score is not None and isinstance(getattr(post, "score", None), int) and post.score < min_score:
             reason = SkipReasons.LOW_SCORE
-        elif blacklist_terms:
+        elif compiled_blacklist:
             # Case-insensitive title blacklist. Treat "rose queen" and "rose_queen" the same.
             # Also collapse repeated whitespace to catch odd spacing.
-            import re
-            norm_title = re.sub(r"\s+", " ", title.replace("_", " ")).strip()
-            for raw in blacklist_terms:
-                term = (raw or "").casefold().strip()
-                if not term:
-                    continue
-                # Match either exact word/phrase boundaries or simple substring for multiword labels.
-                term_spaces = term.replace("_", " ")
-                # Build a safe word-boundary regex for the term-as-words
-                pattern = r"\b" + re.escape(term_spaces) + r"\b"
-                if re.search(pattern, norm_title) or term in title or term_spaces in norm_title:
+            # (A word-boundary match is always also a substring match, so substring checks suffice.)
+            norm_title = _WHITESPACE_RE.sub(" ", title.replace("_", " ")).strip()
+            for term, term_spaces in compiled_blacklist:
+                if term in title or term_spaces in norm_title:
                     reason = SkipReasons.BLACKLISTED
                     break
 
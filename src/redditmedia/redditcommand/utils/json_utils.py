@@ -0,0 +1,24 @@
+# redditcommand/utils/json_utils.py
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson  # optional ("fast" extra): much faster (de)serialization
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def loads(s: Union[str, bytes]) -> Any:
+    """Decode JSON (orjson when installed, stdlib json otherwise); usable as aiohttp's loads=."""
+    if _HAS_ORJSON:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+def dumps_pretty(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes (orjson when installed, stdlib json otherwise)."""
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
@@ -2,7 +2,9 @@
 
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from ..config import LogConfig
 
 
@@ -75,11 +77,50 @@ class LogManager:
     _skip_logger = None
     _accepted_logger = None
     _error_logger = None
+    _queue_listener = None
 
     @classmethod
     def setup_main_logger(cls):
         return BaseLogger.setup_stream_logger()
 
+    @classmethod
+    def start_queue_logging(cls):
+        """
+        Move the root logger's handlers behind a QueueHandler so stream writes
+        happen on a background thread instead of blocking the event loop.
+        """
+        if cls._queue_listener is not None:
+            return cls._queue_listener
+
+        root = BaseLogger.setup_stream_logger()
+        handlers = list(root.handlers)
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+        for handler in handlers:
+            root.removeHandler(handler)
+        root.addHandler(QueueHandler(log_queue))
+
+        listener.start()
+        cls._queue_listener = listener
+        return listener
+
+    @classmethod
+    def stop_queue_logging(cls):
+        """Flush queued records and restore the original root handlers."""
+        listener = cls._queue_listener
+        if listener is None:
+            return
+
+        listener.stop()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, QueueHandler):
+                root.removeHandler(handler)
+        for handler in listener.handlers:
+            root.addHandler(handler)
+        cls._queue_listener = None
+
     @classmethod
     def get_skip_logger(cls):
         if cls._skip_logger is None:
@@ -2,9 +2,10 @@
 
 import os
 import asyncio
+import random
 import aiohttp
 
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 from asyncpraw import Reddit
 from asyncpraw.models import Submission, Comment
 from telegram import InputFile, Bot, Update
@@ -13,7 +14,7 @@ from PIL import Image
 from urllib.parse import urlparse
 
 from .tempfile_utils import TempFileManager
-from ..config import TimeoutConfig, CommentFilterConfig
+from ..config import TimeoutConfig, CommentFilterConfig, RetryConfig, MediaConfig
 from .session import GlobalSession
 from .log_manager import LogManager
 
@@ -199,6 +200,9 @@ class MediaUtils:
         return None
 
 class MediaDownloader:
+    # Process-wide count of retries download_file scheduled, by status (e.g. {429: 3})
+    retry_counts: Dict[int, int] = {}
+
     @staticmethod
     async def find_first_valid_url(urls: list[str], session: Optional[aiohttp.ClientSession] = None) -> Optional[str]:
         session = session or await GlobalSession.get()
@@ -212,24 +216,52 @@ class MediaDownloader:
                 logger.debug(f"Failed to access: {url}")
         return None
 
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+        """Prefer the server's Retry-After (seconds form); else capped exponential backoff + jitter."""
+        cap = RetryConfig.DOWNLOAD_BACKOFF_MAX_SECONDS
+        if retry_after and retry_after.strip().isdigit():
+            return min(cap, float(retry_after.strip()))
+        return min(cap, RetryConfig.DOWNLOAD_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)) + random.uniform(0, 0.5)
+
     @staticmethod
     async def download_file(url: str, file_path: str, session: Optional[aiohttp.ClientSession] = None) -> Optional[str]:
         session = session or await GlobalSession.get()
-        try:
-            timeout = aiohttp.ClientTimeout(total=TimeoutConfig.DOWNLOAD_TIMEOUT)
-            async with session.get(url, timeout=timeout) as response:
-                if response.status == 200:
-                    with open(file_path, 'wb') as f:
-                        while chunk := await response.content.read(1024 * 1024):
-                            f.write(chunk)
-                    logger.info(f"Downloaded to {file_path}")
-                    return file_path
-                else:
-                    logger.error(f"Download failed. Status: {response.status} for URL: {url}")
-        except asyncio.TimeoutError:
-            logger.error(f"Download timed out for URL: {url}")
-        except Exception as e:
-            logger.error(f"Error downloading from {url}: {e}", exc_info=True)
+        attempts = max(1, RetryConfig.DOWNLOAD_ATTEMPTS)
+        for attempt in range(1, attempts + 1):
+            try:
+                timeout = aiohttp.ClientTimeout(total=TimeoutConfig.DOWNLOAD_TIMEOUT)
+                async with session.get(url, timeout=timeout) as response:
+                    if response.status == 200:
+                        size = response.content_length
+                        with open(file_path, 'wb') as f:
+                            if size is not None and size <= MediaConfig.SINGLE_READ_MAX_BYTES:
+                                # Typical images: one read, one write
+                                f.write(await response.read())
+                            else:
+                                while chunk := await response.content.read(MediaConfig.DOWNLOAD_CHUNK_BYTES):
+                                    f.write(chunk)
+                        logger.info(f"Downloaded to {file_path}")
+                        return file_path
+
+                    status = response.status
+                    retry_after = response.headers.get("Retry-After")
+
+                if status not in RetryConfig.RETRYABLE_STATUSES or attempt == attempts:
+                    logger.error(f"Download failed. Status: {status} for URL: {url}")
+                    return None
+
+                MediaDownloader.retry_counts[status] = MediaDownloader.retry_counts.get(status, 0) + 1
+                delay = MediaDownloader._retry_delay(attempt, retry_after)
+                logger.warning(f"Download got {status} for {url}; retry {attempt}/{attempts - 1} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+            except asyncio.TimeoutError:
+                logger.error(f"Download timed out for URL: {url}")
+                return None
+            except Exception as e:
+                logger.error(f"Error downloading from {url}: {e}", exc_info=True)
+                return None
         return None
     
 class CaptionBuilder:
@@ -10,6 +10,7 @@ from typing import Optional, Any, Dict, List
 from ..config import RedditVideoConfig
 from .tempfile_utils import TempFileManager
 from .session import GlobalSession
+from .json_utils import loads as json_loads
 from .log_manager import LogManager
 from .name_utils import temp_paths_for_vreddit
 
@@ -117,7 +118,7 @@ class RedditVideoResolver:
                 if resp.status != 200:
                     logger.debug(f"[Resolver] JSON fetch status {resp.status} for {post_id}")
                     return None
-                return await resp.json(content_type=None)
+                return await resp.json(content_type=None, loads=json_loads)
         except Exception as e:
             logger.debug(f"[Resolver] JSON fetch exception for {post_id}: {e}")
             return None
@@ -1,16 +1,50 @@
 # redditcommand/utils/session.py
 
+import asyncio
+
 import aiohttp
 
+from ..config import SessionConfig
+
 class GlobalSession:
     _session = None
+    _prewarmed: set = set()  # URLs already warmed on the current session
 
     @classmethod
     async def get(cls):
         if cls._session is None or cls._session.closed:
-            cls._session = aiohttp.ClientSession()
+            # One pooled connector for every media host: cached DNS and long keep-alive
+            # let back-to-back downloads reuse warm TLS connections.
+            connector = aiohttp.TCPConnector(
+                limit=SessionConfig.CONNECTOR_LIMIT,
+                limit_per_host=SessionConfig.CONNECTOR_LIMIT_PER_HOST,
+                ttl_dns_cache=SessionConfig.DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=SessionConfig.KEEPALIVE_TIMEOUT_SECONDS,
+            )
+            cls._session = aiohttp.ClientSession(connector=connector)
+            cls._prewarmed = set()
         return cls._session
 
+    @classmethod
+    async def prewarm(cls, urls=SessionConfig.PREWARM_URLS):
+        """
+        Resolve DNS and open pooled TLS connections to the given hosts ahead of the
+        first real download. Best effort: failures are ignored. Runs once per session,
+        so repeated pipeline runs in one process (daemon, batch jobs) don't re-probe.
+        """
+        session = await cls.get()
+        urls = [u for u in urls if u not in cls._prewarmed]
+        if not urls:
+            return
+        cls._prewarmed.update(urls)
+        timeout = aiohttp.ClientTimeout(total=SessionConfig.PREWARM_TIMEOUT_SECONDS)
+
+        async def _head(url):
+            async with session.head(url, timeout=timeout, allow_redirects=False):
+                pass
+
+        await asyncio.gather(*(_head(u) for u in urls), return_exceptions=True)
+
     @classmethod
     async def close(cls):
         if cls._session and not cls._session.closed: